@@ -0,0 +1,57 @@
+"""
+Shared read-only SQLite connection for the ad-hoc analysis scripts
+"""
+
+import os
+import sqlite3
+import sys
+
+DB_PATH = os.environ.get('DATABASE_PATH', '/Users/edwardkim/Code/ai-backtest/backtesting.db')
+
+# Connection-local settings only: nothing here writes to the database file,
+# so opening a reader never takes a lock or changes the journal mode the
+# backend runs in (WAL is opted into once via migrations/2025-11-17-enable-wal.sql).
+# The large page cache and mmap keep repeated range scans in process memory.
+READ_PRAGMAS = """
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-262144;
+PRAGMA mmap_size=1073741824;
+PRAGMA query_only=ON;
+"""
+
+
+# Relative to backend/, where the analysis scripts are run from
+MIGRATIONS_DIR = 'migrations'
+TRADE_DATE_MIGRATION = '2025-11-15-add-ohlcv-trade-date.sql'
+SESSION_SUMMARY_MIGRATION = '2025-11-16-add-session-summary.sql'
+
+
+def connect(path=DB_PATH):
+    """Open the backtesting database tuned for read-heavy analytic queries"""
+    db = sqlite3.connect(path, isolation_level=None)
+    db.executescript(READ_PRAGMAS)
+    return db
+
+
+def require_schema(db, session_summary=False):
+    """
+    Exit with the migration files to apply, instead of a raw
+    OperationalError mid-report, if ohlcv_data lacks trade_date (or, when
+    asked, the session_summary table is missing)
+    """
+    columns = {row[1] for row in db.execute("PRAGMA table_info(ohlcv_data)")}
+    if not columns:
+        print("❌ No ohlcv_data table in this database; check DATABASE_PATH")
+        sys.exit(1)
+    missing = []
+    if 'trade_date' not in columns:
+        missing.append(TRADE_DATE_MIGRATION)
+    if session_summary and db.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'session_summary'"
+    ).fetchone() is None:
+        missing.append(SESSION_SUMMARY_MIGRATION)
+    if missing:
+        print("❌ Database schema is missing columns/tables this script needs. Apply, in order:")
+        for name in missing:
+            print(f"   sqlite3 <db> < {MIGRATIONS_DIR}/{name}")
+        sys.exit(1)
@@ -1,55 +1,85 @@
 #!/usr/bin/env python3
-import sqlite3
+from datetime import datetime, timedelta, timezone
 
-db = sqlite3.connect('/Users/edwardkim/Code/ai-backtest/backtesting.db')
+import numpy as np
+
+from analysis_db import connect, require_schema
+
+db = connect()
+require_schema(db)
 cursor = db.cursor()
 
+
+SESSION_DATE = 20251114  # trade_date (YYYYMMDD, UTC)
+
+
+def to_date(trade_date):
+    return datetime.strptime(str(trade_date), '%Y%m%d').replace(tzinfo=timezone.utc)
+
+
+def previous_session(trade_date):
+    """Prior weekday as a YYYYMMDD trade_date (exchange holidays not handled)"""
+    day = to_date(trade_date) - timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return int(day.strftime('%Y%m%d'))
+
+
+def session_bounds(trade_date):
+    """Epoch-ms range for 14:00:00-21:59:59 UTC on the given day"""
+    day = to_date(trade_date)
+    start = day.replace(hour=14)
+    end = day.replace(hour=21, minute=59, second=59, microsecond=999000)
+    return int(start.timestamp() * 1000), int(end.timestamp() * 1000)
+
+
+# Equality on trade_date plus a timestamp range seeks idx_ohlcv_ticker_date
+# (ticker, trade_date, timestamp) instead of scanning every row
+PREV_DATE = previous_session(SESSION_DATE)
+prev_start_ms, prev_end_ms = session_bounds(PREV_DATE)
+start_ms, end_ms = session_bounds(SESSION_DATE)
+session_label = to_date(SESSION_DATE).strftime('%Y-%m-%d')
+prev_label = to_date(PREV_DATE).strftime('%Y-%m-%d')
+
 # Get prev close
 cursor.execute("""
 SELECT close FROM ohlcv_data
-WHERE ticker='QQQ' AND timeframe='5min'
-  AND date(timestamp/1000, 'unixepoch') = '2025-11-13'
-  AND CAST(strftime('%H', datetime(timestamp/1000, 'unixepoch')) AS INTEGER) >= 14
-  AND CAST(strftime('%H', datetime(timestamp/1000, 'unixepoch')) AS INTEGER) <= 21
+WHERE ticker='QQQ' AND trade_date = ?
+  AND timestamp BETWEEN ? AND ?
+  AND timeframe='5min'
 ORDER BY timestamp DESC LIMIT 1
-""")
+""", (PREV_DATE, prev_start_ms, prev_end_ms))
 prev_close = cursor.fetchone()[0]
 
-# Get first 10 bars of 11-14
+# Get first 10 bars of the session
 cursor.execute("""
-SELECT 
-  strftime('%H:%M:%S', datetime(timestamp/1000, 'unixepoch')) as time,
-  open, high, low, close, volume
+SELECT timestamp, open, high, low, close, volume
 FROM ohlcv_data
-WHERE ticker='QQQ' AND timeframe='5min'
-  AND date(timestamp/1000, 'unixepoch') = '2025-11-14'
-  AND CAST(strftime('%H', datetime(timestamp/1000, 'unixepoch')) AS INTEGER) >= 14
-  AND CAST(strftime('%H', datetime(timestamp/1000, 'unixepoch')) AS INTEGER) <= 21
+WHERE ticker='QQQ' AND trade_date = ?
+  AND timestamp BETWEEN ? AND ?
+  AND timeframe='5min'
 ORDER BY timestamp ASC
 LIMIT 10
-""")
+""", (SESSION_DATE, start_ms, end_ms))
 
 bars = cursor.fetchall()
 first_open = bars[0][1]
 gap_pct = ((first_open - prev_close) / prev_close) * 100
 
-print(f"QQQ Gap Analysis for 2025-11-14:")
-print(f"Previous close (2025-11-13): ${prev_close:.2f}")
-print(f"Open (2025-11-14): ${first_open:.2f}")
+print(f"QQQ Gap Analysis for {session_label}:")
+print(f"Previous close ({prev_label}): ${prev_close:.2f}")
+print(f"Open ({session_label}): ${first_open:.2f}")
 print(f"Gap: {gap_pct:.2f}%")
 print(f"Gap meets -1.0% threshold? {gap_pct <= -1.0}\n")
 
 print("First 10 bars with VWAP:")
-cumVol = 0
-cumVolPrice = 0
-
-for i, bar in enumerate(bars, 1):
-    time, open_, high, low, close, volume = bar
-    typical = (high + low + close) / 3
-    cumVolPrice += typical * volume
-    cumVol += volume
-    vwap = cumVolPrice / cumVol if cumVol > 0 else 0
-    
+timestamps, _, highs, lows, closes, volumes = (np.array(col, dtype=np.float64) for col in zip(*bars))
+cum_vol = np.cumsum(volumes)
+cum_vol_price = np.cumsum((highs + lows + closes) / 3 * volumes)
+vwaps = np.divide(cum_vol_price, cum_vol, out=np.zeros_like(cum_vol), where=cum_vol > 0)
+
+for i, (ts, close, vwap) in enumerate(zip(timestamps, closes, vwaps), 1):
+    time = datetime.fromtimestamp(ts / 1000, tz=timezone.utc).strftime('%H:%M:%S')
     relation = "ABOVE" if close > vwap else "BELOW"
     print(f"{i}. {time}: Close=${close:.2f}, VWAP=${vwap:.2f} ({relation})")
 
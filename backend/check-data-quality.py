@@ -4,79 +4,132 @@ Check data quality and find testable scenarios
 """
 
 import sqlite3
+import sys
+from datetime import datetime, timedelta, timezone
 
-db = sqlite3.connect('/Users/edwardkim/Code/ai-backtest/backtesting.db')
+from analysis_db import connect, require_schema
+
+db = connect()
+db.row_factory = sqlite3.Row
 cursor = db.cursor()
 
+
+def to_trade_date(day):
+    return int(day.strftime('%Y%m%d'))
+
+
+def fmt_trade_date(trade_date):
+    return f"{trade_date // 10000}-{trade_date // 100 % 100:02d}-{trade_date % 100:02d}"
+
+
+# Table rows are formatted in fetchmany() batches and written with one
+# stdout call per batch instead of one print per row
+BATCH_SIZE = 1024
+TICKER_FMT = '{:8} {:4} days  ({} to {})'
+GAP_FMT = '{:8}  {}  {:>6}%  ${:>7.2f}  ${:>7.2f}'
+
+
+def write_batch(lines):
+    if lines:
+        sys.stdout.write('\n'.join(lines))
+        sys.stdout.write('\n')
+
+
+# Both queries below depend on schema added by migrations
+require_schema(db, session_summary=True)
+
 print("🔍 Checking OHLCV Data Quality\n")
 
 # Check what tickers we have
+print("Available Tickers:")
+print("-" * 70)
 cursor.execute("""
-    SELECT ticker, COUNT(DISTINCT date(timestamp/1000, 'unixepoch')) as days,
-           MIN(date(timestamp/1000, 'unixepoch')) as first_date,
-           MAX(date(timestamp/1000, 'unixepoch')) as last_date
+    SELECT ticker, COUNT(DISTINCT trade_date) as days,
+           MIN(trade_date) as first_date,
+           MAX(trade_date) as last_date
     FROM ohlcv_data
     GROUP BY ticker
     ORDER BY days DESC
     LIMIT 10
 """)
-
-print("Available Tickers:")
-print("-" * 70)
-for row in cursor.fetchall():
-    print(f"{row[0]:8} {row[1]:4} days  ({row[2]} to {row[3]})")
+while batch := cursor.fetchmany(BATCH_SIZE):
+    write_batch([
+        TICKER_FMT.format(ticker, days, fmt_trade_date(first_date), fmt_trade_date(last_date))
+        for ticker, days, first_date, last_date in batch
+    ])
 
 print("\n" + "="*70 + "\n")
 
-# Check for actual gaps on recent dates
-cursor.execute("""
-    WITH first_bar AS (
-        SELECT
-            ticker,
-            date(timestamp/1000, 'unixepoch') as trade_date,
-            open as first_open,
-            MIN(timestamp) as first_ts
-        FROM ohlcv_data
-        WHERE date(timestamp/1000, 'unixepoch') >= date('now', '-10 days')
-        GROUP BY ticker, trade_date
-    ),
-    prev_close AS (
+# Check for actual gaps on recent dates (on the scanner's bar size)
+GAP_TIMEFRAME = '5min'
+today = datetime.now(timezone.utc).date()
+report_from = to_trade_date(today - timedelta(days=10))
+# Reach back a few extra days so the first reported session still has a
+# previous close across weekends/holidays
+since_date = to_trade_date(today - timedelta(days=14))
+
+# Gaps come from session_summary (one row per ticker/session, maintained on
+# ingest); LAG() pulls the previous session's close without a self-join
+gaps_sql = """
+    WITH sessions AS (
         SELECT
             ticker,
-            date(timestamp/1000, 'unixepoch') as trade_date,
-            close as last_close,
-            MAX(timestamp) as last_ts
-        FROM ohlcv_data
-        WHERE date(timestamp/1000, 'unixepoch') >= date('now', '-11 days')
-        GROUP BY ticker, trade_date
+            trade_date,
+            first_open,
+            LAG(last_close) OVER (PARTITION BY ticker ORDER BY trade_date) as prev_close
+        FROM session_summary
+        WHERE timeframe = ?
+          AND trade_date >= ?
     )
     SELECT
-        f.ticker,
-        f.trade_date,
-        ROUND(((f.first_open - p.last_close) / p.last_close * 100), 2) as gap_pct,
-        f.first_open,
-        p.last_close
-    FROM first_bar f
-    JOIN prev_close p ON f.ticker = p.ticker
-        AND p.trade_date = date(f.trade_date, '-1 day')
-    WHERE ABS((f.first_open - p.last_close) / p.last_close * 100) > 0.5
+        ticker,
+        trade_date,
+        ROUND(((first_open - prev_close) / prev_close * 100), 2) as gap_pct,
+        first_open,
+        prev_close
+    FROM sessions
+    WHERE trade_date >= ?
+      AND prev_close IS NOT NULL
+      AND (first_open - prev_close) * (first_open - prev_close) > (0.005 * prev_close) * (0.005 * prev_close)
     ORDER BY ABS(gap_pct) DESC
     LIMIT 20
-""")
+"""
+gaps_params = (GAP_TIMEFRAME, since_date, report_from)
 
-gaps = cursor.fetchall()
+# Verify the planner range-seeks session_summary rather than scanning it
+# (pass --explain to print the full plan)
+plan = [row['detail'] for row in cursor.execute("EXPLAIN QUERY PLAN " + gaps_sql, gaps_params)]
+if '--explain' in sys.argv:
+    print("Query plan:")
+    for detail in plan:
+        print(f"   {detail}")
+    print()
+# Match on the index use only: SQLite < 3.36 words it 'SEARCH TABLE session_summary ...'
+if not any('session_summary USING PRIMARY KEY' in detail for detail in plan):
+    print("⚠️  Gap query is scanning session_summary instead of seeking its primary key\n")
 
-if gaps:
-    print("📊 Recent Gaps (>0.5%):\n")
-    print("Ticker    Date          Gap %     Open      Prev Close")
-    print("-" * 70)
-    for row in gaps:
-        print(f"{row[0]:8}  {row[1]}  {row[2]:>6}%  ${row[3]:>7.2f}  ${row[4]:>7.2f}")
+# Stream rows from the cursor in batches; only the top-5 preview is kept
+n_gaps = 0
+preview = []
+cursor.execute(gaps_sql, gaps_params)
+while batch := cursor.fetchmany(BATCH_SIZE):
+    if n_gaps == 0:
+        print("📊 Recent Gaps (>0.5%):\n")
+        print("Ticker    Date          Gap %     Open      Prev Close")
+        print("-" * 70)
+    write_batch([
+        GAP_FMT.format(ticker, fmt_trade_date(trade_date), gap_pct, first_open, prev_close)
+        for ticker, trade_date, gap_pct, first_open, prev_close in batch
+    ])
+    if n_gaps < 5:
+        preview.extend(batch[:5 - n_gaps])
+    n_gaps += len(batch)
 
+if n_gaps:
     print("\n💡 Test these ticker/date combinations:")
     print("-" * 70)
-    for i, row in enumerate(gaps[:5], 1):
-        print(f"{i}. {row[0]} on {row[1]} (Gap: {row[2]}%)")
+    for i, row in enumerate(preview, 1):
+        print(f"{i}. {row['ticker']} on {fmt_trade_date(row['trade_date'])} (Gap: {row['gap_pct']}%)")
 else:
     print("❌ No significant gaps found in recent 10 days")
     print("\n💡 This might mean:")
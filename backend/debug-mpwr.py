@@ -1,19 +1,15 @@
 #!/usr/bin/env python3
 """Debug MPWR on 2025-11-14"""
 
-import requests
 import json
 
-with open('src/templates/scanners/gap-down-vwap-reclaim.ts') as f:
-    scanner = f.read()
+import numpy as np
 
-response = requests.post(
-    'http://localhost:3000/api/scanner-debug',
-    json={'scannerCode': scanner, 'ticker': 'MPWR', 'date': '2025-11-14'},
-    timeout=30
-)
+from scanner_debug_client import load_scanner, make_session, scan
+
+scanner = load_scanner()
 
-result = response.json()
+result = scan(make_session(), scanner, 'MPWR', '2025-11-14')
 
 print(f"📊 MPWR on 2025-11-14 Debug:\n")
 print(f"Bars Scanned: {result['barsScanned']}")
@@ -22,29 +18,34 @@ print(f"Signals Found: {result['signalsFound']}\n")
 if result.get('error'):
     print(f"❌ Error: {result['error']}\n")
 
+# Extract the bar dicts once into parallel columns
+bars = result['sampleBars'][:15]
+times, opens, highs, lows, closes, volumes = (
+    [bar[key] for bar in bars]
+    for key in ('time_of_day', 'open', 'high', 'low', 'close', 'volume')
+)
+
 print("First 15 bars of the day:")
 print("-" * 80)
 print(f"{'#':<3} {'Time':<10} {'Open':>8} {'High':>8} {'Low':>8} {'Close':>8} {'Volume':>10}")
 print("-" * 80)
 
-for i, bar in enumerate(result['sampleBars'][:15], 1):
-    print(f"{i:<3} {bar['time_of_day']:<10} ${bar['open']:>7.2f} ${bar['high']:>7.2f} ${bar['low']:>7.2f} ${bar['close']:>7.2f} {bar['volume']:>10,}")
+for i, (t, o, h, l, c, v) in enumerate(zip(times, opens, highs, lows, closes, volumes), 1):
+    print(f"{i:<3} {t:<10} ${o:>7.2f} ${h:>7.2f} ${l:>7.2f} ${c:>7.2f} {v:>10,}")
 
 # Calculate VWAP for first few bars manually
 print("\n" + "="*80)
 print("Manual VWAP Calculation (first 5 bars):")
 print("="*80)
 
-cumVol = 0
-cumVolPrice = 0
-for i, bar in enumerate(result['sampleBars'][:5], 1):
-    typical = (bar['high'] + bar['low'] + bar['close']) / 3
-    cumVolPrice += typical * bar['volume']
-    cumVol += bar['volume']
-    vwap = cumVolPrice / cumVol if cumVol > 0 else 0
+h, l, c, v = (np.array(col[:5], dtype=np.float64) for col in (highs, lows, closes, volumes))
+cum_vol = np.cumsum(v)
+cum_vol_price = np.cumsum((h + l + c) / 3 * v)
+vwaps = np.divide(cum_vol_price, cum_vol, out=np.zeros_like(cum_vol), where=cum_vol > 0)
 
-    above_vwap = "✅ ABOVE" if bar['close'] > vwap else "❌ BELOW"
-    print(f"Bar {i} ({bar['time_of_day']}): Close=${bar['close']:.2f}, VWAP=${vwap:.2f} {above_vwap}")
+for i, (t, close, vwap) in enumerate(zip(times, c, vwaps), 1):
+    above_vwap = "✅ ABOVE" if close > vwap else "❌ BELOW"
+    print(f"Bar {i} ({t}): Close=${close:.2f}, VWAP=${vwap:.2f} {above_vwap}")
 
 if result['signalsFound'] > 0:
     print("\n✅ Signals found:")
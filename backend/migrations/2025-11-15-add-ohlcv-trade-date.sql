@@ -0,0 +1,28 @@
+-- Add derived trade_date column to ohlcv_data
+-- Date: 2025-11-15
+-- Purpose: Materialize the UTC session date (YYYYMMDD integer) so day-sliced
+--          queries filter on an indexed column instead of recomputing
+--          date(timestamp/1000, 'unixepoch') for every row
+
+ALTER TABLE ohlcv_data ADD COLUMN trade_date INTEGER;
+
+-- Backfill existing rows
+UPDATE ohlcv_data
+SET trade_date = CAST(strftime('%Y%m%d', timestamp/1000, 'unixepoch') AS INTEGER)
+WHERE trade_date IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_ohlcv_ticker_date ON ohlcv_data(ticker, trade_date, timestamp);
+
+-- Keep trade_date populated for new bars (INSERT OR REPLACE fires this too)
+CREATE TRIGGER IF NOT EXISTS trg_ohlcv_trade_date
+AFTER INSERT ON ohlcv_data
+FOR EACH ROW WHEN NEW.trade_date IS NULL
+BEGIN
+    UPDATE ohlcv_data
+    SET trade_date = CAST(strftime('%Y%m%d', NEW.timestamp/1000, 'unixepoch') AS INTEGER)
+    WHERE id = NEW.id;
+END;
+
+ANALYZE ohlcv_data;
+
+SELECT 'Migration complete! Added trade_date column, index and trigger to ohlcv_data' AS status;
@@ -0,0 +1,61 @@
+-- Add session_summary table (per-day first open / last close per ticker)
+-- Date: 2025-11-16
+-- Purpose: Gap calculations read one row per ticker/session instead of
+--          re-aggregating every intraday bar in ohlcv_data
+-- Requires: 2025-11-15-add-ohlcv-trade-date.sql
+
+CREATE TABLE IF NOT EXISTS session_summary (
+    ticker TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    trade_date INTEGER NOT NULL,       -- UTC date as YYYYMMDD
+    first_ts INTEGER NOT NULL,         -- Timestamp (ms) of the first bar
+    first_open REAL NOT NULL,
+    last_ts INTEGER NOT NULL,          -- Timestamp (ms) of the last bar
+    last_close REAL NOT NULL,
+    -- Leading (timeframe, trade_date) lets "recent sessions" queries range-seek
+    PRIMARY KEY (timeframe, trade_date, ticker)
+) WITHOUT ROWID;
+
+-- Populate from existing bars
+INSERT OR REPLACE INTO session_summary
+SELECT ticker, timeframe, trade_date, first_ts, first_open, last_ts, last_close
+FROM (
+    SELECT
+        ticker,
+        timeframe,
+        trade_date,
+        FIRST_VALUE(timestamp) OVER w as first_ts,
+        FIRST_VALUE(open) OVER w as first_open,
+        LAST_VALUE(timestamp) OVER w as last_ts,
+        LAST_VALUE(close) OVER w as last_close,
+        ROW_NUMBER() OVER w as rn
+    FROM ohlcv_data
+    WINDOW w AS (
+        PARTITION BY ticker, timeframe, trade_date
+        ORDER BY timestamp
+        ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+    )
+)
+WHERE rn = 1;
+
+-- Keep it current on ingest. Re-inserting an existing bar (INSERT OR REPLACE)
+-- overwrites the same first/last values, so the upsert is idempotent.
+CREATE TRIGGER IF NOT EXISTS trg_session_summary
+AFTER INSERT ON ohlcv_data
+FOR EACH ROW
+BEGIN
+    INSERT INTO session_summary (ticker, timeframe, trade_date, first_ts, first_open, last_ts, last_close)
+    VALUES (
+        NEW.ticker,
+        NEW.timeframe,
+        CAST(strftime('%Y%m%d', NEW.timestamp/1000, 'unixepoch') AS INTEGER),
+        NEW.timestamp, NEW.open, NEW.timestamp, NEW.close
+    )
+    ON CONFLICT (ticker, timeframe, trade_date) DO UPDATE SET
+        first_open = CASE WHEN excluded.first_ts <= first_ts THEN excluded.first_open ELSE first_open END,
+        first_ts = MIN(first_ts, excluded.first_ts),
+        last_close = CASE WHEN excluded.last_ts >= last_ts THEN excluded.last_close ELSE last_close END,
+        last_ts = MAX(last_ts, excluded.last_ts);
+END;
+
+SELECT 'Migration complete! Added session_summary table and trigger' AS status;
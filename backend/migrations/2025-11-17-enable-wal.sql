@@ -0,0 +1,9 @@
+-- Switch backtesting.db to WAL journal mode
+-- Date: 2025-11-17
+-- Purpose: Let the read-only analysis scripts (analysis_db.connect) read while
+--          the backend is mid-ingest instead of waiting on the rollback journal
+-- Note: journal_mode is persistent in the database file and cannot change
+--       inside a transaction; run once, while the backend is stopped:
+--          sqlite3 backtesting.db < migrations/2025-11-17-enable-wal.sql
+
+PRAGMA journal_mode=WAL;
@@ -0,0 +1,127 @@
+"""
+Shared HTTP client setup for the scanner-debug test scripts
+
+scan() keeps successful responses in an on-disk cache (.scanner-cache/,
+needs diskcache) for CACHE_TTL seconds. Set SCANNER_DEBUG_NO_CACHE=1 to
+bypass it, e.g. right after a data backfill, or delete the directory.
+"""
+
+import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from diskcache import Cache
+except ImportError:
+    Cache = None
+
+SCANNER_DEBUG_URL = 'http://localhost:3000/api/scanner-debug'
+# Relative to backend/, where the scripts are run from
+SCANNER_PATH = 'src/templates/scanners/gap-down-vwap-reclaim.ts'
+POOL_SIZE = 16
+MAX_WORKERS = 12
+CACHE_DIR = '.scanner-cache'
+CACHE_TTL = 24 * 3600  # seconds; bounds how stale a response can be after a backfill
+
+_cache = None
+
+
+def make_session(pool_size=POOL_SIZE):
+    """Session with a keep-alive connection pool sized for the thread pool"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    return session
+
+
+def run_probes(probe, items, max_workers=MAX_WORKERS):
+    """Run probe over items concurrently, yielding (item, result) as each completes"""
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = {ex.submit(probe, item): item for item in items}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def register_scanner(session, scanner_code):
+    """Register scanner code with the server once and return its scannerId"""
+    response = session.post(
+        f'{SCANNER_DEBUG_URL}/register',
+        json={'scannerCode': scanner_code},
+        timeout=30
+    )
+    response.raise_for_status()
+    return response.json()['scannerId']
+
+
+def scanner_digest(path):
+    """
+    Map a scanner file read-only and return (sha256 hex, mapped bytes).
+    The digest equals the scannerId the server assigns to the same source.
+    """
+    with open(path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return hashlib.sha256(mm).hexdigest(), mm
+
+
+def load_scanner(path=SCANNER_PATH):
+    """
+    The (digest, source) pair for scan()/post_by_id(): only the digest is
+    sent unless the server asks for the code
+    """
+    return scanner_digest(path)
+
+
+def post_by_id(session, scanner_id, scanner_source, ticker, date, **extra):
+    """
+    POST a debug request that references the scanner by id only. If the
+    server does not know the id yet (412), resend once with the source and
+    ask the server to register it for the remaining requests.
+    """
+    body = {'scannerId': scanner_id, 'ticker': ticker, 'date': date, **extra}
+    response = session.post(SCANNER_DEBUG_URL, json=body, timeout=30)
+    if response.status_code == 412:
+        body['scannerCode'] = bytes(scanner_source).decode()
+        body['registerScanner'] = True
+        response = session.post(SCANNER_DEBUG_URL, json=body, timeout=30)
+    return response
+
+
+def _response_cache():
+    global _cache
+    if os.environ.get('SCANNER_DEBUG_NO_CACHE'):
+        return None
+    if _cache is None and Cache is not None:
+        _cache = Cache(CACHE_DIR)
+    return _cache
+
+
+def scan(session, scanner, ticker, date, **extra):
+    """
+    Debug one ticker/date. scanner is the (digest, source) pair from
+    load_scanner(), hashed once per process; the request goes through
+    post_by_id() and the digest doubles as the response cache key.
+
+    Responses are reused from disk for up to CACHE_TTL. Only successful
+    results without data-quality warnings are cached. Without diskcache
+    installed, or with SCANNER_DEBUG_NO_CACHE set, every call goes to the
+    server.
+    """
+    scanner_id, scanner_source = scanner
+    cache = _response_cache()
+    key = (scanner_id, ticker, date, tuple(sorted(extra.items())))
+    if cache is not None:
+        result = cache.get(key)
+        if result is not None:
+            return result
+
+    response = post_by_id(session, scanner_id, scanner_source, ticker, date, **extra)
+    result = response.json()
+    # Responses flagged with data-quality warnings are expected to change once
+    # the data is backfilled, so they are never cached
+    if cache is not None and response.ok and not result.get('error') and not result.get('dataQualityWarnings'):
+        cache.set(key, result, expire=CACHE_TTL)
+    return result
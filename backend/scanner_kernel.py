@@ -0,0 +1,122 @@
+"""
+Same-process port of the gap-down VWAP reclaim scanner
+(src/templates/scanners/gap-down-vwap-reclaim.ts) for local debugging.
+
+The numeric inner loop is JIT-compiled with numba when it is installed;
+without numba it runs as plain Python with identical results.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+# Mirror the template's ADJUSTABLE PARAMETERS
+MIN_GAP_PERCENT = 2.0
+MIN_VOLUME_RATIO = 1.5
+MIN_VWAP_CROSSES = 2
+LOOKBACK_BARS = 20
+
+
+@njit(cache=True)
+def vwap_and_crosses(open_, high, low, close, vol, prev_close, gap_thresh,
+                     min_crosses=MIN_VWAP_CROSSES, min_volume_ratio=MIN_VOLUME_RATIO,
+                     lookback=LOOKBACK_BARS):
+    """
+    Run the scanner's per-day loop over one session's bars.
+
+    Returns (vwap, cross_count, volume_ratio, signal_idx); signal_idx is -1
+    when the gap filter fails or no bar qualifies.
+    """
+    n = close.shape[0]
+    vwap = np.zeros(n)
+    cum_vol = 0.0
+    cum_vol_price = 0.0
+    for i in range(n):
+        cum_vol_price += (high[i] + low[i] + close[i]) / 3 * vol[i]
+        cum_vol += vol[i]
+        vwap[i] = cum_vol_price / cum_vol if cum_vol > 0 else 0.0
+
+    gap_percent = (open_[0] - prev_close) / prev_close * 100
+    if gap_percent >= -gap_thresh:
+        return vwap, 0, 0.0, -1
+
+    crosses = 0
+    was_below = open_[0] < vwap[0]
+    for i in range(1, n):
+        is_below = close[i] < vwap[i]
+        if was_below and not is_below:
+            crosses += 1
+        was_below = is_below
+
+        if crosses >= min_crosses:
+            window = min(lookback, i)
+            total = 0.0
+            for j in range(i - window, i):
+                total += vol[j]
+            avg_volume = total / window
+            volume_ratio = vol[i] / avg_volume if avg_volume > 0 else 0.0
+            if volume_ratio >= min_volume_ratio:
+                return vwap, crosses, volume_ratio, i
+
+    return vwap, crosses, 0.0, -1
+
+
+def load_session(db, ticker, date):
+    """Regular-hours bars (14:00-21:59 UTC) for ticker on YYYY-MM-DD as float64 columns"""
+    day = datetime.strptime(date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+    start_ms = int(day.replace(hour=14).timestamp() * 1000)
+    end_ms = int(day.replace(hour=21, minute=59, second=59, microsecond=999000).timestamp() * 1000)
+    rows = db.execute("""
+        SELECT timestamp, open, high, low, close, volume
+        FROM ohlcv_data
+        WHERE ticker = ? AND trade_date = ?
+          AND timestamp BETWEEN ? AND ?
+        ORDER BY timestamp ASC
+    """, (ticker, int(day.strftime('%Y%m%d')), start_ms, end_ms)).fetchall()
+    if not rows:
+        return None
+    return tuple(np.array(col, dtype=np.float64) for col in zip(*rows))
+
+
+def scan_local(db, ticker, date):
+    """Evaluate the scanner on one ticker/date; returns a /api/scanner-debug shaped dict"""
+    today = load_session(db, ticker, date)
+    # The template looks back one calendar day (no weekend handling)
+    prev_date = (datetime.strptime(date, '%Y-%m-%d') - timedelta(days=1)).strftime('%Y-%m-%d')
+    prev = load_session(db, ticker, prev_date)
+
+    bars_scanned = 0 if today is None else len(today[0])
+    result = {'ticker': ticker, 'date': date, 'barsScanned': bars_scanned, 'signalsFound': 0}
+    if today is None or prev is None or bars_scanned < 10:
+        return result
+
+    ts, open_, high, low, close, vol = today
+    prev_close = prev[4][-1]
+    vwap, crosses, volume_ratio, idx = vwap_and_crosses(open_, high, low, close, vol, prev_close, MIN_GAP_PERCENT)
+    if idx < 0:
+        return result
+
+    gap_percent = (open_[0] - prev_close) / prev_close * 100
+    pattern_strength = min(100, abs(gap_percent) / 5 * 30 + crosses * 20 + min(volume_ratio, 3) / 3 * 50)
+    signal_time = datetime.fromtimestamp(ts[idx] / 1000, tz=timezone.utc).strftime('%H:%M:%S')
+    result['signalsFound'] = 1
+    result['signals'] = [{
+        'ticker': ticker,
+        'signal_date': date,
+        'signal_time': signal_time,
+        'pattern_strength': round(pattern_strength),
+        'entry_price': float(close[idx]),
+        'gap_percent': round(gap_percent, 2),
+        'vwap_crosses': int(crosses),
+        'volume_ratio': round(volume_ratio, 2),
+        'metrics': {'vwap_at_signal': round(float(vwap[idx]), 2)},
+    }]
+    return result
@@ -15,14 +15,27 @@ const debugService = new ScannerDebugService();
  */
 router.post('/', async (req: Request, res: Response) => {
   try {
-    const { scannerCode, ticker, date, explain } = req.body;
+    const { scannerId, ticker, date, explain } = req.body;
 
-    if (!scannerCode || !ticker || !date) {
+    if ((!req.body.scannerCode && !scannerId) || !ticker || !date) {
       return res.status(400).json({
-        error: 'Missing required fields: scannerCode, ticker, date'
+        error: 'Missing required fields: scannerCode (or scannerId), ticker, date'
       });
     }
 
+    const scannerCode = req.body.scannerCode || debugService.getRegisteredScanner(scannerId);
+    if (!scannerCode) {
+      return res.status(412).json({
+        error: `Unknown scannerId: ${scannerId}. Resend with scannerCode and registerScanner: true, or register it via /api/scanner-debug/register`
+      });
+    }
+
+    // A client retrying after 412 asks for its code to be remembered so
+    // follow-up requests can send just the hash; plain uploads aren't stored
+    if (req.body.scannerCode && req.body.registerScanner) {
+      debugService.registerScanner(scannerCode);
+    }
+
     const result = await debugService.debugScanner({
       scannerCode,
       ticker,
@@ -40,6 +53,23 @@ router.post('/', async (req: Request, res: Response) => {
   }
 });
 
+/**
+ * POST /api/scanner-debug/register
+ * Register scanner code once and get back a scannerId for later requests.
+ * Only the source is stored; each debug run still executes it via ts-node.
+ */
+router.post('/register', (req: Request, res: Response) => {
+  const { scannerCode } = req.body;
+
+  if (!scannerCode) {
+    return res.status(400).json({
+      error: 'Missing required field: scannerCode'
+    });
+  }
+
+  res.json({ scannerId: debugService.registerScanner(scannerCode) });
+});
+
 /**
  * POST /api/scanner-debug/validate
  * Quick validation: Check if scanner finds any signals on sample days
@@ -5,6 +5,7 @@
  * Provides dry-run mode with detailed visibility into scanner execution.
  */
 
+import * as crypto from 'crypto';
 import * as fs from 'fs';
 import * as path from 'path';
 import { getDatabase } from '../database/db';
@@ -58,6 +59,42 @@ export interface DebugResponse {
 }
 
 export class ScannerDebugService {
+  // Scanner source registered via /register, keyed by SHA-256 of the code.
+  // Bounded LRU (Map keeps insertion order) so a long-running server used
+  // for scanner iteration doesn't keep every version ever uploaded.
+  private static readonly MAX_REGISTERED_SCANNERS = 32;
+  private scannerCache = new Map<string, string>();
+
+  /**
+   * Register scanner code so callers can reference it by id instead of
+   * re-uploading the full source on every debug request
+   */
+  registerScanner(scannerCode: string): string {
+    const scannerId = crypto.createHash('sha256').update(scannerCode).digest('hex');
+    this.scannerCache.delete(scannerId);
+    this.scannerCache.set(scannerId, scannerCode);
+    if (this.scannerCache.size > ScannerDebugService.MAX_REGISTERED_SCANNERS) {
+      const oldest = this.scannerCache.keys().next().value;
+      if (oldest !== undefined) {
+        this.scannerCache.delete(oldest);
+      }
+    }
+    return scannerId;
+  }
+
+  /**
+   * Look up previously registered scanner code (undefined if unknown)
+   */
+  getRegisteredScanner(scannerId: string): string | undefined {
+    const scannerCode = this.scannerCache.get(scannerId);
+    if (scannerCode !== undefined) {
+      // Mark as most recently used
+      this.scannerCache.delete(scannerId);
+      this.scannerCache.set(scannerId, scannerCode);
+    }
+    return scannerCode;
+  }
+
   /**
    * Run scanner in debug mode on a specific ticker/date
    */
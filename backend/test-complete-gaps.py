@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
-import requests
 import json
 
-with open('src/templates/scanners/gap-down-vwap-reclaim.ts') as f:
-    scanner = f.read()
+from scanner_debug_client import load_scanner, make_session, run_probes, scan
+
+scanner = load_scanner()
 
 # Gap-downs with complete data (>60 bars)
 test_cases = [
@@ -14,19 +14,20 @@ test_cases = [
     ("BTDR", "2025-11-11", -36.55),
 ]
 
+session = make_session()
+
+
+def probe(case):
+    ticker, date, _ = case
+    return scan(session, scanner, ticker, date)
+
+
 print("🔍 Testing scanner on gap-downs with COMPLETE data\n")
 
-for ticker, date, expected_gap in test_cases:
-    response = requests.post(
-        'http://localhost:3000/api/scanner-debug',
-        json={'scannerCode': scanner, 'ticker': ticker, 'date': date},
-        timeout=30
-    )
-    result = response.json()
-    
+for (ticker, date, expected_gap), result in run_probes(probe, test_cases):
     status = "✅" if result['signalsFound'] > 0 else "❌"
     print(f"{status} {ticker} {date}: {result['barsScanned']} bars, {result['signalsFound']} signals")
-    
+
     if result['signalsFound'] > 0:
         for sig in result['signals']:
             print(f"   📊 Gap: {sig['gap_percent']}%, Entry: ${sig['entry_price']}, VWAP Crosses: {sig['vwap_crosses']}, Vol Ratio: {sig['volume_ratio']}")
@@ -1,12 +1,11 @@
 #!/usr/bin/env python3
 """Test scanner on gap-down candidates"""
 
-import requests
 import json
 
-# Read scanner template
-with open('src/templates/scanners/gap-down-vwap-reclaim.ts') as f:
-    scanner = f.read()
+from scanner_debug_client import load_scanner, make_session, run_probes, scan
+
+scanner = load_scanner()
 
 # Gap-down candidates from check-data-quality.py
 test_cases = [
@@ -17,44 +16,43 @@ test_cases = [
     ("AERTW", "2025-11-11", -28.90),
 ]
 
+session = make_session()
+
+
+def probe(case):
+    ticker, date, _ = case
+    try:
+        return scan(session, scanner, ticker, date, explain=False), None
+    except Exception as e:
+        return None, e
+
+
 print("🔍 Testing gap-down VWAP reclaim scanner on known gap-down days\n")
 print("=" * 70)
 
 signals_found = []
 
-for ticker, date, expected_gap in test_cases:
-    try:
-        response = requests.post(
-            'http://localhost:3000/api/scanner-debug',
-            json={
-                'scannerCode': scanner,
-                'ticker': ticker,
-                'date': date,
-                'explain': False
-            },
-            timeout=30
-        )
-        result = response.json()
-
-        status = "✅" if result['signalsFound'] > 0 else "❌"
-        print(f"\n{status} {ticker} on {date} (Expected gap: {expected_gap:.1f}%)")
-        print(f"   Bars scanned: {result['barsScanned']}")
-        print(f"   Signals found: {result['signalsFound']}")
-
-        if result.get('dataQualityWarnings'):
-            for warning in result['dataQualityWarnings']:
-                print(f"   ⚠️  {warning}")
-
-        if result['signalsFound'] > 0:
-            signals_found.append((ticker, date, result['signals']))
-            for signal in result['signals']:
-                print(f"   📊 Signal: Gap {signal['gap_percent']}%, Entry ${signal['entry_price']}, Strength {signal['pattern_strength']}")
-
-        if result.get('error'):
-            print(f"   ❌ Error: {result['error']}")
+for (ticker, date, expected_gap), (result, exc) in run_probes(probe, test_cases):
+    if exc is not None:
+        print(f"\n❌ {ticker} on {date}: Error - {str(exc)}")
+        continue
 
-    except Exception as e:
-        print(f"\n❌ {ticker} on {date}: Error - {str(e)}")
+    status = "✅" if result['signalsFound'] > 0 else "❌"
+    print(f"\n{status} {ticker} on {date} (Expected gap: {expected_gap:.1f}%)")
+    print(f"   Bars scanned: {result['barsScanned']}")
+    print(f"   Signals found: {result['signalsFound']}")
+
+    if result.get('dataQualityWarnings'):
+        for warning in result['dataQualityWarnings']:
+            print(f"   ⚠️  {warning}")
+
+    if result['signalsFound'] > 0:
+        signals_found.append((ticker, date, result['signals']))
+        for signal in result['signals']:
+            print(f"   📊 Signal: Gap {signal['gap_percent']}%, Entry ${signal['entry_price']}, Strength {signal['pattern_strength']}")
+
+    if result.get('error'):
+        print(f"   ❌ Error: {result['error']}")
 
 print("\n" + "=" * 70)
 print(f"\n📊 Summary: Found {len(signals_found)} ticker/date combinations with signals\n")
@@ -4,11 +4,10 @@ Test scanner on multiple recent dates to find gap-downs
 """
 
 import json
-import requests
 
-# Read the scanner template
-with open('src/templates/scanners/gap-down-vwap-reclaim.ts', 'r') as f:
-    scanner_code = f.read()
+from scanner_debug_client import load_scanner, make_session, run_probes, scan
+
+scanner = load_scanner()
 
 # Test on multiple recent dates
 test_cases = [
@@ -22,41 +21,36 @@ test_cases = [
     ("AMD", "2025-11-14"),
 ]
 
-print("🔍 Testing scanner on multiple recent dates...")
-print("Looking for gap-down patterns...\n")
-
-found_signals = []
+session = make_session()
 
-for ticker, date in test_cases:
-    payload = {
-        "scannerCode": scanner_code,
-        "ticker": ticker,
-        "date": date,
-        "explain": False
-    }
 
+def probe(case):
+    ticker, date = case
     try:
-        response = requests.post(
-            'http://localhost:3000/api/scanner-debug',
-            json=payload,
-            timeout=30
-        )
-        result = response.json()
+        return scan(session, scanner, ticker, date, explain=False), None
+    except Exception as e:
+        return None, e
 
-        print(f"{ticker} {date}: ", end='')
 
-        if result['signalsFound'] > 0:
-            print(f"✅ {result['signalsFound']} signal(s) found!")
-            found_signals.append({
-                'ticker': ticker,
-                'date': date,
-                'signals': result['signals']
-            })
-        else:
-            print(f"❌ No signals")
+print("🔍 Testing scanner on multiple recent dates...")
+print("Looking for gap-down patterns...\n")
 
-    except Exception as e:
-        print(f"⚠️  Error: {e}")
+found_signals = []
+
+for (ticker, date), (result, exc) in run_probes(probe, test_cases):
+    print(f"{ticker} {date}: ", end='')
+
+    if exc is not None:
+        print(f"⚠️  Error: {exc}")
+    elif result['signalsFound'] > 0:
+        print(f"✅ {result['signalsFound']} signal(s) found!")
+        found_signals.append({
+            'ticker': ticker,
+            'date': date,
+            'signals': result['signals']
+        })
+    else:
+        print(f"❌ No signals")
 
 print("\n" + "="*60)
 print(f"\n📊 Summary: Found signals on {len(found_signals)} days\n")
@@ -1,17 +1,11 @@
 #!/usr/bin/env python3
-import requests
 import json
 
-with open('src/templates/scanners/gap-down-vwap-reclaim.ts') as f:
-    scanner = f.read()
+from scanner_debug_client import load_scanner, make_session, scan
 
-response = requests.post(
-    'http://localhost:3000/api/scanner-debug',
-    json={'scannerCode': scanner, 'ticker': 'QQQ', 'date': '2025-11-14'},
-    timeout=30
-)
+scanner = load_scanner()
 
-result = response.json()
+result = scan(make_session(), scanner, 'QQQ', '2025-11-14')
 
 print(f"📊 QQQ on 2025-11-14:\n")
 print(f"Bars scanned: {result['barsScanned']}")
@@ -0,0 +1,188 @@
+"""
+Shared loading and headline statistics for the backtest result analysis
+scripts in tmp/ (analyze-*.py, compare-all-strategies.py)
+"""
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+import heapq
+import os
+from dataclasses import dataclass
+
+import numpy as np
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+# Files at least this large are stream-parsed (when ijson is installed) so
+# the full list of trade dicts is never resident; smaller files use one
+# orjson parse, which is faster
+STREAM_MIN_BYTES = 64 * 1024 * 1024
+
+# Below this many trades the NumPy reductions beat the JIT's dispatch/compile cost
+NUMBA_MIN_TRADES = 5000
+
+
+@njit(cache=True)
+def _push_top(top, filled, pnl, i, sign):
+    """Insert trade i into top (sorted best-first by sign * pnl); ties stay behind earlier trades"""
+    k = top.shape[0]
+    key = sign * pnl[i]
+    if filled == k and key <= sign * pnl[top[k - 1]]:
+        return
+    j = min(filled, k - 1)
+    while j > 0 and key > sign * pnl[top[j - 1]]:
+        top[j] = top[j - 1]
+        j -= 1
+    top[j] = i
+
+
+@njit(cache=True)
+def _aggregate(pnl, k=5):
+    """
+    One pass over pnl with no temporaries: win/loss counts and sums, total,
+    and the indices of the k best winners and k worst losers. Unused top-k
+    slots are -1.
+    """
+    n_win = 0
+    n_loss = 0
+    gross_profit = 0.0
+    gross_loss = 0.0
+    total = 0.0
+    top_win = np.full(k, -1, np.int64)
+    top_loss = np.full(k, -1, np.int64)
+    for i in range(pnl.shape[0]):
+        p = pnl[i]
+        total += p
+        if p > 0:
+            _push_top(top_win, min(n_win, k), pnl, i, 1.0)
+            n_win += 1
+            gross_profit += p
+        elif p < 0:
+            _push_top(top_loss, min(n_loss, k), pnl, i, -1.0)
+            n_loss += 1
+            gross_loss -= p
+    return n_win, n_loss, gross_profit, gross_loss, total, top_win, top_loss
+
+
+def _array_start(f):
+    """Byte offset of the first line that opens the JSON array (skips stderr preamble lines)"""
+    start = 0
+    for line in iter(f.readline, b''):
+        if line.lstrip().startswith(b'['):
+            return start
+        start += len(line)
+    raise ValueError(f"No JSON array found in {f.name}")
+
+
+def read_result_json(path):
+    """Parse a backtest result file, ignoring any stderr lines before the array"""
+    with open(path, 'rb') as f:
+        f.seek(_array_start(f))
+        return _json.loads(f.read())
+
+
+def load_trades(path, columns=()):
+    """
+    Parse a backtest result file into a float64 pnlPercent array plus one
+    object array per requested field, skipping entries without a pnlPercent.
+    Returns (pnl, {field: array}). The parsed trade dicts are not kept.
+    """
+    pnl_values = []
+    values = {field: [] for field in columns}
+
+    def collect(trades):
+        # Structure-of-arrays: one lookup per field per trade
+        for t in trades:
+            p = t.get('pnlPercent')
+            if p is None:
+                continue
+            pnl_values.append(p)
+            for field, col in values.items():
+                col.append(t[field])
+
+    if ijson is not None and os.path.getsize(path) >= STREAM_MIN_BYTES:
+        # Same preamble rule as read_result_json, then one trade dict at a time
+        with open(path, 'rb') as f:
+            f.seek(_array_start(f))
+            collect(ijson.items(f, 'item', use_float=True))
+    else:
+        collect(read_result_json(path))
+
+    pnl = np.array(pnl_values, dtype=np.float64)
+    return pnl, {field: np.array(col, dtype=object) for field, col in values.items()}
+
+
+@dataclass
+class Stats:
+    n: int
+    n_win: int
+    n_loss: int
+    gross_profit: float
+    gross_loss: float
+    total: float
+    top_win: list   # indices of the 5 best winners, best first
+    top_loss: list  # indices of the 5 worst losers, worst first
+
+    @property
+    def win_rate(self):
+        return self.n_win / self.n * 100
+
+    @property
+    def loss_rate(self):
+        return self.n_loss / self.n * 100
+
+    @property
+    def avg_win(self):
+        return self.gross_profit / self.n_win if self.n_win else 0
+
+    @property
+    def avg_loss(self):
+        return -self.gross_loss / self.n_loss if self.n_loss else 0
+
+    @property
+    def expectancy(self):
+        """Average P&L per trade"""
+        return self.total / self.n
+
+    @property
+    def profit_factor(self):
+        return self.gross_profit / self.gross_loss if self.gross_loss > 0 else 0
+
+
+def summarize(pnl):
+    """Headline stats for a pnlPercent array, or None if it is empty"""
+    n = len(pnl)
+    if n == 0:
+        return None
+
+    if n > NUMBA_MIN_TRADES:
+        n_win, n_loss, gross_profit, gross_loss, total, top_win, top_loss = _aggregate(pnl)
+        top_win = top_win[top_win >= 0].tolist()
+        top_loss = top_loss[top_loss >= 0].tolist()
+    else:
+        win_mask = pnl > 0
+        loss_mask = pnl < 0
+        n_win = int(np.count_nonzero(win_mask))
+        n_loss = int(np.count_nonzero(loss_mask))
+        gross_profit = float(pnl[win_mask].sum())
+        gross_loss = float(-pnl[loss_mask].sum())
+        total = float(pnl.sum())
+        # Bounded O(n log 5) selection; like sorted()[:5], ties keep file order
+        top_win = heapq.nlargest(5, np.flatnonzero(win_mask), key=pnl.__getitem__)
+        top_loss = heapq.nsmallest(5, np.flatnonzero(loss_mask), key=pnl.__getitem__)
+
+    return Stats(n, int(n_win), int(n_loss), float(gross_profit), float(gross_loss), float(total), top_win, top_loss)
@@ -1,53 +1,61 @@
-import json
+import numpy as np
 
-with open('tmp/orb-results-fixed.json') as f:
-    lines = f.readlines()
-    data = json.loads(''.join(lines[1:]))
+from _trade_stats import read_result_json
+
+data = read_result_json('tmp/orb-results-fixed.json')
 
 trades = [t for t in data if t.get('pnlPercent') is not None]
 
 print(f"📈 OPENING RANGE BREAKOUT (FIXED EXECUTION)\n")
 print(f"Fix: Use realistic entry price (bar open) instead of historical OR high\n")
 print(f"Total Trades: {len(trades)}")
-winners = [t for t in trades if t['pnlPercent'] > 0]
-losers = [t for t in trades if t['pnlPercent'] < 0]
-print(f"Winners: {len(winners)} ({len(winners)/len(trades)*100:.1f}%)")
-print(f"Losers: {len(losers)} ({len(losers)/len(trades)*100:.1f}%)")
+# One contiguous float64 column; every statistic below is a vectorized reduction
+pnl = np.fromiter((t['pnlPercent'] for t in trades), dtype=np.float64, count=len(trades))
+win_mask = pnl > 0
+loss_mask = pnl < 0
+n_win = int(np.count_nonzero(win_mask))
+n_loss = int(np.count_nonzero(loss_mask))
+print(f"Winners: {n_win} ({n_win/len(trades)*100:.1f}%)")
+print(f"Losers: {n_loss} ({n_loss/len(trades)*100:.1f}%)")
 
-avg_win = sum(t['pnlPercent'] for t in winners) / len(winners) if winners else 0
-avg_loss = sum(t['pnlPercent'] for t in losers) / len(losers) if losers else 0
-avg_pnl = sum(t['pnlPercent'] for t in trades) / len(trades)
-total_pnl = sum(t['pnlPercent'] for t in trades)
+gross_profit = float(pnl[win_mask].sum())
+gross_loss = float(-pnl[loss_mask].sum())
+avg_win = gross_profit / n_win if n_win else 0
+avg_loss = -gross_loss / n_loss if n_loss else 0
+total_pnl = float(pnl.sum())
+avg_pnl = total_pnl / len(trades)
 
 print(f"\nAvg Win: +{avg_win:.2f}%")
 print(f"Avg Loss: {avg_loss:.2f}%")
 print(f"Avg P&L: {avg_pnl:+.2f}%")
 print(f"Total P&L: {total_pnl:+.2f}%")
 
-gross_profit = sum(t['pnlPercent'] for t in winners)
-gross_loss = abs(sum(t['pnlPercent'] for t in losers))
 profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0
 
 print(f"Profit Factor: {profit_factor:.2f}")
 
 from collections import defaultdict
-by_reason = defaultdict(list)
+# Running [count, sum] per exit reason instead of a list of pnls per group
+by_reason = defaultdict(lambda: [0, 0.0])
 for t in trades:
-    by_reason[t['exitReason']].append(t['pnlPercent'])
+    agg = by_reason[t['exitReason']]
+    agg[0] += 1
+    agg[1] += t['pnlPercent']
 
 print(f"\n📋 Exit Reasons:\n")
-for reason, pnls in sorted(by_reason.items(), key=lambda x: -len(x[1])):
-    avg = sum(pnls) / len(pnls)
-    print(f"  {reason}: {len(pnls)} trades, avg {avg:+.2f}%")
+for reason, (count, total) in sorted(by_reason.items(), key=lambda x: -x[1][0]):
+    print(f"  {reason}: {count} trades, avg {total / count:+.2f}%")
 
 print(f"\n🏆 Top 5 Winners:\n")
-top_winners = sorted(winners, key=lambda x: -x['pnlPercent'])[:5]
-for t in top_winners:
+win_idx = np.flatnonzero(win_mask)
+for i in win_idx[np.argsort(-pnl[win_idx], kind='stable')[:5]]:
+    t = trades[i]
     print(f"  {t['ticker']} {t['date']}: +{t['pnlPercent']:.2f}% ({t['exitReason']})")
 
 print(f"\n📉 Top 5 Losers:\n")
-top_losers = sorted(losers, key=lambda x: x['pnlPercent'])[:5]
-for t in top_losers:
+loss_idx = np.flatnonzero(loss_mask)
+for i in loss_idx[np.argsort(pnl[loss_idx], kind='stable')[:5]]:
+    t = trades[i]
     print(f"  {t['ticker']} {t['date']}: {t['pnlPercent']:.2f}% ({t['exitReason']})")
 
 # Sample MU trade for validation
@@ -73,5 +81,5 @@ print(f"="*60)
 print(f"\nORIGINAL (buggy entry at OR high):")
 print(f"  Total P&L: +56.89% | Avg: +0.34% | WR: 54.5% | PF: 3.27")
 print(f"\nFIXED (realistic entry at bar open):")
-print(f"  Total P&L: {total_pnl:+.2f}% | Avg: {avg_pnl:+.2f}% | WR: {len(winners)/len(trades)*100:.1f}% | PF: {profit_factor:.2f}")
+print(f"  Total P&L: {total_pnl:+.2f}% | Avg: {avg_pnl:+.2f}% | WR: {n_win/len(trades)*100:.1f}% | PF: {profit_factor:.2f}")
 print(f"\n{'✅ PROFITABLE' if avg_pnl > 0 else '❌ UNPROFITABLE'}")
@@ -1,14 +1,11 @@
-import json
-
-with open('tmp/orb-results-validated.json') as f:
-    lines = f.readlines()
-    # Skip validation summary (first 4 lines)
-    json_start = 0
-    for i, line in enumerate(lines):
-        if line.strip().startswith('['):
-            json_start = i
-            break
-    data = json.loads(''.join(lines[json_start:]))
+import numpy as np
+
+from _trade_stats import read_result_json
+
+# Entry-time bucket per hour of day (entryTime is zero-padded HH:MM:SS)
+BUCKETS = ('13:00+',) * 9 + ('09:30-10:00', '10:00-11:00', '11:00-12:00', '12:00-13:00') + ('13:00+',) * 11
+
+data = read_result_json('tmp/orb-results-validated.json')
 
 trades = [t for t in data if t.get('pnlPercent') is not None]
 errors = [t for t in trades if t.get('validationErrors')]
@@ -29,71 +26,73 @@ if errors:
             print(f"  - {err}")
     print()
 
-winners = [t for t in trades if t['pnlPercent'] > 0]
-losers = [t for t in trades if t['pnlPercent'] < 0]
-print(f"Winners: {len(winners)} ({len(winners)/len(trades)*100:.1f}%)")
-print(f"Losers: {len(losers)} ({len(losers)/len(trades)*100:.1f}%)")
-
-avg_win = sum(t['pnlPercent'] for t in winners) / len(winners) if winners else 0
-avg_loss = sum(t['pnlPercent'] for t in losers) / len(losers) if losers else 0
-avg_pnl = sum(t['pnlPercent'] for t in trades) / len(trades)
-total_pnl = sum(t['pnlPercent'] for t in trades)
+# One contiguous float64 column; every statistic below is a vectorized reduction
+pnl = np.fromiter((t['pnlPercent'] for t in trades), dtype=np.float64, count=len(trades))
+win_mask = pnl > 0
+loss_mask = pnl < 0
+n_win = int(np.count_nonzero(win_mask))
+n_loss = int(np.count_nonzero(loss_mask))
+print(f"Winners: {n_win} ({n_win/len(trades)*100:.1f}%)")
+print(f"Losers: {n_loss} ({n_loss/len(trades)*100:.1f}%)")
+
+gross_profit = float(pnl[win_mask].sum())
+gross_loss = float(-pnl[loss_mask].sum())
+avg_win = gross_profit / n_win if n_win else 0
+avg_loss = -gross_loss / n_loss if n_loss else 0
+total_pnl = float(pnl.sum())
+avg_pnl = total_pnl / len(trades)
 
 print(f"\nAvg Win: +{avg_win:.2f}%")
 print(f"Avg Loss: {avg_loss:.2f}%")
 print(f"Avg P&L: {avg_pnl:+.2f}%")
 print(f"Total P&L: {total_pnl:+.2f}%")
 
-gross_profit = sum(t['pnlPercent'] for t in winners)
-gross_loss = abs(sum(t['pnlPercent'] for t in losers))
 profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0
 
 print(f"Profit Factor: {profit_factor:.2f}")
 
 from collections import defaultdict
-by_reason = defaultdict(list)
+# Running [count, sum] per exit reason instead of a list of pnls per group
+by_reason = defaultdict(lambda: [0, 0.0])
 for t in trades:
-    by_reason[t['exitReason']].append(t['pnlPercent'])
+    agg = by_reason[t['exitReason']]
+    agg[0] += 1
+    agg[1] += t['pnlPercent']
 
 print(f"\n📋 Exit Reasons:\n")
-for reason, pnls in sorted(by_reason.items(), key=lambda x: -len(x[1])):
-    avg = sum(pnls) / len(pnls)
-    print(f"  {reason}: {len(pnls)} trades, avg {avg:+.2f}%")
+for reason, (count, total) in sorted(by_reason.items(), key=lambda x: -x[1][0]):
+    print(f"  {reason}: {count} trades, avg {total / count:+.2f}%")
 
 # Timing analysis
-by_timing = defaultdict(list)
+# Running [count, sum, wins] per entry-time bucket
+by_timing = defaultdict(lambda: [0, 0.0, 0])
 for t in trades:
     entry_time = t.get('entryTime', '')
     if entry_time:
-        hour = int(entry_time.split(':')[0])
-        if hour == 9:
-            bucket = '09:30-10:00'
-        elif hour == 10:
-            bucket = '10:00-11:00'
-        elif hour == 11:
-            bucket = '11:00-12:00'
-        elif hour == 12:
-            bucket = '12:00-13:00'
-        else:
-            bucket = '13:00+'
-        by_timing[bucket].append(t['pnlPercent'])
+        agg = by_timing[BUCKETS[int(entry_time[:2])]]
+        pnl_pct = t['pnlPercent']
+        agg[0] += 1
+        agg[1] += pnl_pct
+        agg[2] += pnl_pct > 0
 
 print(f"\n⏰ Entry Time Analysis:\n")
 for bucket in ['09:30-10:00', '10:00-11:00', '11:00-12:00', '12:00-13:00', '13:00+']:
     if bucket in by_timing:
-        pnls = by_timing[bucket]
-        avg = sum(pnls) / len(pnls)
-        winners_pct = len([p for p in pnls if p > 0]) / len(pnls) * 100
-        print(f"  {bucket}: {len(pnls)} trades, avg {avg:+.2f}%, WR {winners_pct:.1f}%")
+        count, total, wins = by_timing[bucket]
+        avg = total / count
+        winners_pct = wins / count * 100
+        print(f"  {bucket}: {count} trades, avg {avg:+.2f}%, WR {winners_pct:.1f}%")
 
 print(f"\n🏆 Top 5 Winners:\n")
-top_winners = sorted(winners, key=lambda x: -x['pnlPercent'])[:5]
-for t in top_winners:
+win_idx = np.flatnonzero(win_mask)
+for i in win_idx[np.argsort(-pnl[win_idx], kind='stable')[:5]]:
+    t = trades[i]
     print(f"  {t['ticker']} {t['date']} (entry {t['entryTime']}): +{t['pnlPercent']:.2f}% ({t['exitReason']})")
 
 print(f"\n📉 Top 5 Losers:\n")
-top_losers = sorted(losers, key=lambda x: x['pnlPercent'])[:5]
-for t in top_losers:
+loss_idx = np.flatnonzero(loss_mask)
+for i in loss_idx[np.argsort(pnl[loss_idx], kind='stable')[:5]]:
+    t = trades[i]
     print(f"  {t['ticker']} {t['date']} (entry {t['entryTime']}): {t['pnlPercent']:.2f}% ({t['exitReason']})")
 
 # MU validation
@@ -120,5 +119,5 @@ print(f"   Signals: 168 | P&L: +56.89% | Avg: +0.34% | WR: 54.5% | PF: 3.27")
 print(f"\n2. FIXED (entry at bar open, delayed signal):")
 print(f"   Signals: 168 | P&L: -13.78% | Avg: -0.08% | WR: 39.4% | PF: 0.71")
 print(f"\n3. PROPER (entry at bar open, immediate signal):")
-print(f"   Signals: {len(trades)} | P&L: {total_pnl:+.2f}% | Avg: {avg_pnl:+.2f}% | WR: {len(winners)/len(trades)*100:.1f}% | PF: {profit_factor:.2f}")
+print(f"   Signals: {len(trades)} | P&L: {total_pnl:+.2f}% | Avg: {avg_pnl:+.2f}% | WR: {n_win/len(trades)*100:.1f}% | PF: {profit_factor:.2f}")
 print(f"\n{'✅ PROFITABLE' if avg_pnl > 0 else '❌ UNPROFITABLE'}")
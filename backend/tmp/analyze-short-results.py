@@ -1,53 +1,41 @@
-import json
+import sys
 
-with open('tmp/short-backtest-results.json') as f:
-    lines = f.readlines()
-    data = json.loads(''.join(lines[1:]))  # Skip first line (stderr)
+import numpy as np
 
-trades = [t for t in data if t.get('pnlPercent') is not None]
+from _trade_stats import load_trades, summarize
 
-print(f"📊 SHORT Strategy Results (Gap-Up Fade)\n")
-print(f"Total Trades: {len(trades)}")
-print(f"Winners: {len([t for t in trades if t['pnlPercent'] > 0])} ({len([t for t in trades if t['pnlPercent'] > 0])/len(trades)*100:.1f}%)")
-print(f"Losers: {len([t for t in trades if t['pnlPercent'] < 0])} ({len([t for t in trades if t['pnlPercent'] < 0])/len(trades)*100:.1f}%)")
-
-winners = [t for t in trades if t['pnlPercent'] > 0]
-losers = [t for t in trades if t['pnlPercent'] < 0]
-
-avg_win = sum(t['pnlPercent'] for t in winners) / len(winners) if winners else 0
-avg_loss = sum(t['pnlPercent'] for t in losers) / len(losers) if losers else 0
-avg_pnl = sum(t['pnlPercent'] for t in trades) / len(trades)
-total_pnl = sum(t['pnlPercent'] for t in trades)
-
-print(f"\nAvg Win: +{avg_win:.2f}%")
-print(f"Avg Loss: {avg_loss:.2f}%")
-print(f"Avg P&L: {avg_pnl:.2f}%")
-print(f"Total P&L: {total_pnl:.2f}%")
-
-gross_profit = sum(t['pnlPercent'] for t in winners)
-gross_loss = abs(sum(t['pnlPercent'] for t in losers))
-profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0
-
-print(f"Profit Factor: {profit_factor:.2f}")
-
-# Group by exit reason
-from collections import defaultdict
-by_reason = defaultdict(list)
-for t in trades:
-    by_reason[t['exitReason']].append(t['pnlPercent'])
+pnl, cols = load_trades('tmp/short-backtest-results.json', ('exitReason', 'ticker', 'date'))
+reasons, tickers, dates = cols['exitReason'], cols['ticker'], cols['date']
+stats = summarize(pnl)
 
+print(f"📊 SHORT Strategy Results (Gap-Up Fade)\n")
+print(f"Total Trades: {stats.n}")
+print(f"Winners: {stats.n_win} ({stats.win_rate:.1f}%)")
+print(f"Losers: {stats.n_loss} ({stats.loss_rate:.1f}%)")
+
+print(f"\nAvg Win: +{stats.avg_win:.2f}%")
+print(f"Avg Loss: {stats.avg_loss:.2f}%")
+print(f"Avg P&L: {stats.expectancy:.2f}%")
+print(f"Total P&L: {stats.total:.2f}%")
+
+print(f"Profit Factor: {stats.profit_factor:.2f}")
+
+# Columnar group-by: integer codes per exit reason, then bincount for
+# per-group counts and pnl sums
+uniq, first, inv, counts = np.unique(reasons, return_index=True, return_inverse=True, return_counts=True)
+sums = np.bincount(inv, weights=pnl, minlength=len(uniq))
+avgs = sums / counts
+# Most trades first; equal counts keep first-seen order
+order = np.argsort(first, kind='stable')
+order = order[np.argsort(-counts[order], kind='stable')]
+
+# Each block is formatted in one join and written with a single call
 print(f"\n📋 Exit Reasons:\n")
-for reason, pnls in sorted(by_reason.items(), key=lambda x: -len(x[1])):
-    avg = sum(pnls) / len(pnls)
-    print(f"  {reason}: {len(pnls)} trades, avg {avg:+.2f}%")
+sys.stdout.write(''.join(f"  {uniq[g]}: {counts[g]} trades, avg {avgs[g]:+.2f}%\n" for g in order))
 
 # Top winners/losers
 print(f"\n🏆 Top 5 Winners:\n")
-top_winners = sorted(winners, key=lambda x: -x['pnlPercent'])[:5]
-for t in top_winners:
-    print(f"  {t['ticker']} {t['date']}: +{t['pnlPercent']:.2f}% ({t['exitReason']})")
+sys.stdout.write(''.join(f"  {tickers[i]} {dates[i]}: +{pnl[i]:.2f}% ({reasons[i]})\n" for i in stats.top_win))
 
 print(f"\n📉 Top 5 Losers:\n")
-top_losers = sorted(losers, key=lambda x: x['pnlPercent'])[:5]
-for t in top_losers:
-    print(f"  {t['ticker']} {t['date']}: {t['pnlPercent']:.2f}% ({t['exitReason']})")
+sys.stdout.write(''.join(f"  {tickers[i]} {dates[i]}: {pnl[i]:.2f}% ({reasons[i]})\n" for i in stats.top_loss))
@@ -1,29 +1,60 @@
 #!/usr/bin/env python3
 """
 Fetch S&P 500 ticker list from Wikipedia
+
+The comma-separated list is cached in ~/.cache/sp500_tickers.csv and
+reused for a week; requests/lxml are only imported when the cache is stale.
 """
 
-import pandas as pd
 import sys
+import time
+from pathlib import Path
+
+CACHE_PATH = Path.home() / '.cache' / 'sp500_tickers.csv'
+CACHE_TTL = 7 * 86400  # seconds
+
+
+def report(tickers):
+    print(f"Found {len(tickers)} S&P 500 tickers", file=sys.stderr)
+    print(f"First 10: {', '.join(tickers[:10])}", file=sys.stderr)
+    print(f"Last 10: {', '.join(tickers[-10:])}", file=sys.stderr)
+
+
+if CACHE_PATH.exists() and time.time() - CACHE_PATH.stat().st_mtime < CACHE_TTL:
+    cached = CACHE_PATH.read_text().strip()
+    report(cached.split(','))
+    print(cached)
+    sys.exit(0)
 
 try:
-    # Read S&P 500 list from Wikipedia
+    import lxml.html
+    import requests
+
+    # Read S&P 500 list from Wikipedia (first column of the first wikitable)
     url = 'https://en.wikipedia.org/wiki/List_of_S%26P_500_companies'
-    tables = pd.read_html(url)
-    sp500_table = tables[0]
+    response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=30)
+    response.raise_for_status()
+    doc = lxml.html.fromstring(response.content)
+    cells = doc.xpath('(//table[contains(@class, "wikitable")])[1]//tr/td[1]')
 
     # Get ticker symbols
-    tickers = sp500_table['Symbol'].tolist()
+    tickers = [cell.text_content().strip() for cell in cells]
+    tickers = [t for t in tickers if t]
 
     # Clean up tickers (replace . with - for compatibility)
     tickers = [t.replace('.', '-') for t in tickers]
 
-    print(f"Found {len(tickers)} S&P 500 tickers", file=sys.stderr)
-    print(f"First 10: {', '.join(tickers[:10])}", file=sys.stderr)
-    print(f"Last 10: {', '.join(tickers[-10:])}", file=sys.stderr)
+    report(tickers)
 
     # Output as comma-separated list
-    print(','.join(tickers))
+    output = ','.join(tickers)
+    print(output)
+
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_PATH.write_text(output + '\n')
+    except OSError as e:
+        print(f"Could not write ticker cache: {e}", file=sys.stderr)
 
 except Exception as e:
     print(f"Error fetching S&P 500 list: {e}", file=sys.stderr)